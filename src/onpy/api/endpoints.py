@@ -66,14 +66,24 @@ class EndpointContainer:
         version: VersionTarget,
         element_id: str,
         script: str,
+        queries: dict[str, list[str]] | None = None,
         return_type: type[T] = str,
     ) -> T:
-        """Evaluates a snipit of featurescript"""
+        """Evaluates a snipit of featurescript. Queries are passed to the
+        script by key, e.g., queries.my_key"""
+
+        payload = model.FeaturescriptUpload(script=script)
+
+        if queries:
+            payload.queries = [
+                model.FeaturescriptQuery(key=key, value=value)
+                for key, value in queries.items()
+            ]
 
         return self.api.post(
             endpoint=f"/partstudios/d/{document_id}/{version.wvm}/{version.wvmid}/e/{element_id}/featurescript",
             response_type=return_type,
-            payload=model.FeaturescriptUpload(script=script),
+            payload=payload,
         )
 
     def list_features(
@@ -189,16 +189,43 @@ class FeatureListResponse(ApiModel):
     defaultFeatures: list[Feature]
 
 
+class FeaturescriptQuery(ApiModel):
+    """Represents a query passed to a featurescript by its transient ids"""
+
+    key: str
+    value: list[str]
+
+
 class FeaturescriptUpload(ApiModel):
     """Request model of POST /partstudios/DWE/featurescript"""
 
     script: str
+    queries: Optional[list[FeaturescriptQuery]] = None
 
 
 class FeaturescriptResponse(ApiModel):
     result: dict | None
 
 
+class FeaturescriptString(ApiModel):
+    """Represents a featurescript string value"""
+
+    value: str
+
+
+class FeaturescriptStringArray(ApiModel):
+    """Represents a featurescript array of string values"""
+
+    value: list[FeaturescriptString]
+
+
+class FeaturescriptStringArrayResponse(ApiModel):
+    """Response of POST /partstudios/DWE/featurescript for scripts that return
+    an array of strings, like transient ids"""
+
+    result: FeaturescriptStringArray | None
+
+
 class Sketch(Feature):
     """Represents a Sketch Feature"""
 
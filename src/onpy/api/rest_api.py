@@ -13,6 +13,8 @@ OnPy - May 2024 - Kyle Tennison
 
 import json
 import requests
+from functools import cache
+from pydantic import TypeAdapter
 from loguru import logger
 from requests.auth import HTTPBasicAuth
 from typing import TYPE_CHECKING, Callable
@@ -24,6 +26,19 @@ from onpy.util.exceptions import OnPyApiError, OnPyInternalError
 if TYPE_CHECKING:
     from onpy.client import Client
 
+try:
+    # orjson is optional; it decodes large responses much faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+@cache
+def _list_adapter[T: ApiModel | str](response_type: type[T]) -> TypeAdapter[list[T]]:
+    """Gets a TypeAdapter that validates a list of the response type. Cached so
+    that the validation schema is only built once per type"""
+    return TypeAdapter(list[response_type])
+
 
 class RestApi:
     """Interface for OnShape API Requests"""
@@ -79,13 +94,15 @@ class RestApi:
             payload_json = payload.model_dump(exclude_none=True)
 
         logger.debug(f"{http_method.name} {endpoint}")
-        logger.trace(
-            f"Calling {http_method.name} {endpoint}"
-            + (
+        logger.opt(lazy=True).trace(
+            "Calling {} {}{}",
+            lambda: http_method.name,
+            lambda: endpoint,
+            lambda: (
                 f" with payload:\n{json.dumps(payload_json, indent=4)}"
                 if payload
                 else ""
-            )
+            ),
         )
 
         # TODO: wrap this in a try/except to catch timeouts
@@ -98,19 +115,21 @@ class RestApi:
 
         # deserialize response
         try:
-            if r.text.strip() == "":
+            if r.content.strip() == b"":
                 response_dict: dict = {}  # allow empty responses
             else:
-                response_dict = r.json()
-            logger.trace(
-                f"{http_method.name} {endpoint} responded with:\n"
-                f"{json.dumps(response_dict, indent=4)}"
+                response_dict = json_loads(r.content)
+            logger.opt(lazy=True).trace(
+                "{} {} responded with:\n{}",
+                lambda: http_method.name,
+                lambda: endpoint,
+                lambda: json.dumps(response_dict, indent=4),
             )
-        except requests.JSONDecodeError as e:
+        except ValueError as e:
             raise OnPyApiError("Response is not json", r)
 
         if issubclass(response_type, ApiModel):
-            return response_type(**response_dict)
+            return response_type.model_validate(response_dict)
 
         elif issubclass(response_type, str):
             return response_type(r.text)
@@ -141,12 +160,12 @@ class RestApi:
 
         response_raw = self.http_wrap(http_method, endpoint, str, payload)
 
-        response_list = json.loads(response_raw)
+        response_list = json_loads(response_raw)
 
         if not isinstance(response_list, list):
             raise OnPyApiError(f"Endpoint {endpoint} expected list response")
 
-        return [response_type(**i) for i in response_list]
+        return _list_adapter(response_type).validate_python(response_list)
 
     def post[
         T: ApiModel | str
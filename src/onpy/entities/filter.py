@@ -11,8 +11,7 @@ OnPy - May 2024 - Kyle Tennison
 
 """
 
-from textwrap import dedent
-from typing import TYPE_CHECKING, override
+from typing import TYPE_CHECKING, Iterator, override
 
 import onpy.api.model as model
 from onpy.util.misc import unwrap
@@ -25,75 +24,134 @@ if TYPE_CHECKING:
     from onpy.elements.partstudio import PartStudio
 
 
-class EntityFilter[T: Entity](FaceEntityConvertible):
-    """Object used to list and filter queries"""
+# Featurescript used to evaluate a query on a set of entities. The transient
+# ids of the entities are passed in the "tids" query of the request, so the
+# script source only depends on the query being applied
+_APPLY_QUERY_TMPL = (
+    "function(context is Context, queries){{ "
+    "return transientQueriesToStrings(evaluateQuery(context, {spec})); "
+    "}}"
+)
+
 
-    def __init__(self, partstudio: "PartStudio", available: list[T]) -> None:
-        self._available = available
+class EntityFilter[T: Entity](FaceEntityConvertible):
+    """Object used to list and filter queries
+
+    Filters are lazy; each filtering method adds a query to the chain, and the
+    whole chain is evaluated in one featurescript call when the entities are
+    first read.
+    """
+
+    def __init__(
+        self,
+        partstudio: "PartStudio",
+        available: list[T],
+        entity_type: type[T] = Entity,
+        pending: list["qtypes.QueryType"] | None = None,
+        *,
+        transient_ids: tuple[str, ...] | None = None,
+    ) -> None:
+        """
+        Args:
+            partstudio: The partstudio that owns the entities
+            available: The entities to filter
+            entity_type: The type of the filtered entities. Defaults to a
+                generic Entity
+            pending: An optional list of queries to apply to the available
+                entities, in order. These are evaluated when the entities are
+                first read
+            transient_ids: The transient ids of the entities to filter. Chained
+                filters pass these instead of building the entities
+        """
+        if transient_ids is None:
+            transient_ids = tuple(e.transient_id for e in available)
+
+        self._entity_type = entity_type
+        self._source_tids = transient_ids
+        self._pending = pending if pending else []
+        self._evaluated_tids: tuple[str, ...] | None = (
+            None if self._pending else transient_ids
+        )
+        self._entities: list[T] | None = (
+            None if self._pending or not available else available
+        )
         self._partstudio = partstudio
         self._client = partstudio._client
         self._api = partstudio._api
 
     @property
-    def _entity_type(self) -> type[T]:
-        """The class of the generic type T"""
-
-        orig_class = getattr(self, "__orig__class__", None)
+    def _available(self) -> list[T]:
+        """The entities that match the filter. Evaluates any pending queries"""
 
-        if orig_class:
-            etype = orig_class.__args__[0]
-        else:
-            etype = Entity
-
-        if not callable(etype):
-            etype = Entity  # default to generic entity
-
-        assert issubclass(etype, Entity) or etype is Entity
+        if self._entities is None:
+            entity_type = self._entity_type
+            self._entities = list(map(entity_type, self._flush()))
 
-        return etype  # type: ignore
+        return self._entities
 
     @override
     def _face_entities(self) -> list[FaceEntity]:
         return self.is_type(FaceEntity)._available
 
-    def _apply_query(self, query: "qtypes.QueryType") -> list[T]:
-        """Builds the featurescript to evaluate a query and evaluates the featurescript
+    def _flush(self) -> tuple[str, ...]:
+        """Evaluates the pending queries, if they have not been evaluated yet
+
+        Returns:
+            The transient ids of the entities that match the filter
+        """
+
+        if self._evaluated_tids is None:
+            self._evaluated_tids = self._apply_query(self._pending)
+
+        return self._evaluated_tids
+
+    def _chain[
+        E: Entity
+    ](self, query: "qtypes.QueryType", entity_type: type[E]) -> "EntityFilter[E]":
+        """Creates a new filter with an additional query at the end of the chain
 
         Args:
-            query: The query to apply
+            query: The query to add
+            entity_type: The entity type of the new filter
 
         Returns:
-            A list of resulting Entity instances
+            A new, unevaluated EntityFilter
         """
 
-        script = dedent(
-            f"""
-                      
-        function(context is Context, queries){{   
-
-            // Combine all transient ids into one query
-            const transient_ids = {[e.transient_id for e in self._available]};
-            var element_queries is array = makeArray(size(transient_ids));
-            
-            var idx = 0;
-            for (var tid in transient_ids)
-            {{
-                var query = {{ "queryType" : QueryType.TRANSIENT, "transientId" : tid }} as Query;
-                element_queries[idx] = query;
-                idx += 1;
-            }}
-            
-            var cumulative_query = qUnion(element_queries);
-            
-            // Apply specific query
-            var specific_query = {query.inject_featurescript("cumulative_query")};
-            var matching_entities = evaluateQuery(context, specific_query);
-            return transientQueriesToStrings(matching_entities);
-            
-        }}
+        if self._evaluated_tids is not None:
+            # build off of the evaluated entities instead of redoing the chain
+            transient_ids, pending = self._evaluated_tids, [query]
+        else:
+            transient_ids, pending = self._source_tids, self._pending + [query]
+
+        return EntityFilter(
+            partstudio=self._partstudio,
+            available=[],
+            entity_type=entity_type,
+            pending=pending,
+            transient_ids=transient_ids,
+        )
+
+    def _apply_query(self, queries: list["qtypes.QueryType"]) -> tuple[str, ...]:
+        """Builds the featurescript to evaluate a chain of queries and evaluates
+        the featurescript
+
+        Args:
+            queries: The queries to apply, in order
 
+        Returns:
+            The transient ids of the resulting entities
         """
-        )
+
+        if not self._source_tids:
+            return ()
+
+        # nest queries so that the first query is applied first
+        spec = "queries.tids"
+        for query in queries:
+            spec = query.inject_featurescript(spec)
+
+        script = _APPLY_QUERY_TMPL.format(spec=spec)
 
         result = unwrap(
             self._api.endpoints.eval_featurescript(
@@ -101,17 +159,23 @@ class EntityFilter[T: Entity](FaceEntityConvertible):
                 version=WorkspaceWVM(self._partstudio.document.default_workspace.id),
                 element_id=unwrap(self._partstudio.id),
                 script=script,
-                return_type=model.FeaturescriptResponse,
+                queries={"tids": list(self._source_tids)},
+                return_type=model.FeaturescriptStringArrayResponse,
             ).result,
             message=f"Query raised error when evaluating fs. Script:\n\n{script}",
         )
 
-        transient_ids = [i["value"] for i in result["value"]]
-        query_entities = [self._entity_type(transient_id=tid) for tid in transient_ids]
+        return tuple([v.value for v in result.value])
 
-        return query_entities
+    def eval(self) -> list[T]:
+        """Evaluates the filter
 
-    def contains_point(self, point: tuple[float, float, float]) -> "EntityFilter":
+        Returns:
+            A list of the entities that match the filter
+        """
+        return list(self._available)
+
+    def contains_point(self, point: tuple[float, float, float]) -> "EntityFilter[T]":
         """Filters out all queries that don't contain the provided point
 
         Args:
@@ -120,11 +184,9 @@ class EntityFilter[T: Entity](FaceEntityConvertible):
 
         query = qtypes.qContainsPoint(point=point, units=self._client.units)
 
-        return EntityFilter[T](
-            partstudio=self._partstudio, available=self._apply_query(query)
-        )
+        return self._chain(query, self._entity_type)
 
-    def closest_to(self, point: tuple[float, float, float]) -> "EntityFilter":
+    def closest_to(self, point: tuple[float, float, float]) -> "EntityFilter[T]":
         """Gets the entity closest to the point
 
         Args:
@@ -133,31 +195,25 @@ class EntityFilter[T: Entity](FaceEntityConvertible):
 
         query = qtypes.qClosestTo(point=point, units=self._client.units)
 
-        return EntityFilter[T](
-            partstudio=self._partstudio, available=self._apply_query(query)
-        )
+        return self._chain(query, self._entity_type)
 
-    def largest(self) -> "EntityFilter":
+    def largest(self) -> "EntityFilter[T]":
         """Gets the largest entity"""
 
         query = qtypes.qLargest()
 
-        return EntityFilter[T](
-            partstudio=self._partstudio, available=self._apply_query(query)
-        )
+        return self._chain(query, self._entity_type)
 
-    def smallest(self) -> "EntityFilter":
+    def smallest(self) -> "EntityFilter[T]":
         """Gets the smallest entity"""
 
         query = qtypes.qSmallest()
 
-        return EntityFilter[T](
-            partstudio=self._partstudio, available=self._apply_query(query)
-        )
+        return self._chain(query, self._entity_type)
 
     def intersects(
         self, origin: tuple[float, float, float], direction: tuple[float, float, float]
-    ) -> "EntityFilter":
+    ) -> "EntityFilter[T]":
         """Gets the queries that intersect an infinite line
 
         Args:
@@ -170,9 +226,7 @@ class EntityFilter[T: Entity](FaceEntityConvertible):
             line_origin=origin, line_direction=direction, units=self._client.units
         )
 
-        return EntityFilter[T](
-            partstudio=self._partstudio, available=self._apply_query(query)
-        )
+        return self._chain(query, self._entity_type)
 
     def is_type[E: Entity](self, entity_type: type[E]) -> "EntityFilter[E]":
         """Gets the queries of a specific type
@@ -184,11 +238,10 @@ class EntityFilter[T: Entity](FaceEntityConvertible):
 
         query = qtypes.qEntityType(entity_type=entity_type)
 
-        available: list[E] = [
-            entity_type(e.transient_id) for e in self._apply_query(query)
-        ]
+        return self._chain(query, entity_type)
 
-        return EntityFilter[E](partstudio=self._partstudio, available=available)
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._available)
 
     def __str__(self) -> str:
         """NOTE: for debugging purposes"""
@@ -10,7 +10,6 @@ OnPy - May 2024 - Kyle Tennison
 
 """
 
-from textwrap import dedent
 from loguru import logger
 from typing import TYPE_CHECKING
 from abc import ABC, abstractmethod
@@ -30,6 +29,15 @@ if TYPE_CHECKING:
     from onpy.entities import EntityFilter
 
 
+# Featurescript to get the bodies created by a feature
+_CREATED_PARTS_TMPL = (
+    "function(context is Context, queries) {{ "
+    'var query = qCreatedBy(makeId("{feature_id}"), EntityType.BODY); '
+    "return transientQueriesToStrings(evaluateQuery(context, query)); "
+    "}}"
+)
+
+
 class Feature(ABC):
     """An abstract base class for OnShape elements"""
 
@@ -134,29 +142,21 @@ class Feature(ABC):
             A list of Part objects
         """
 
-        script = dedent(
-            f"""
-            function(context is Context, queries) {{
-                var query = qCreatedBy(makeId("{self.id}"), EntityType.BODY);
-
-                return transientQueriesToStrings( evaluateQuery(context, query) ); 
-            }}
-            """
-        )
+        script = _CREATED_PARTS_TMPL.format(feature_id=self.id)
 
         response = self._client._api.endpoints.eval_featurescript(
             document_id=self.partstudio.document.id,
             version=WorkspaceWVM(self.partstudio.document.default_workspace.id),
             element_id=self.partstudio.id,
             script=script,
-            return_type=model.FeaturescriptResponse,
+            return_type=model.FeaturescriptStringArrayResponse,
         )
 
         part_ids_raw = unwrap(
             response.result, message="Featurescript failed get parts created by feature"
-        )["value"]
+        ).value
 
-        part_ids = [i["value"] for i in part_ids_raw]
+        part_ids = [i.value for i in part_ids_raw]
 
         available_parts = self._api.endpoints.list_parts(
             document_id=self.partstudio.document.id,
@@ -9,7 +9,6 @@ OnPy - May 2024 - Kyle Tennison
 
 """
 
-from textwrap import dedent
 import onpy.api.model as model
 from onpy.part import Part
 from onpy.util.misc import unwrap
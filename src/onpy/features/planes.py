@@ -11,7 +11,6 @@ OnPy - May 2024 - Kyle Tennison
 
 from enum import Enum
 from functools import cache
-from textwrap import dedent
 from abc import abstractmethod
 from typing import TYPE_CHECKING, override
 
@@ -26,6 +25,24 @@ if TYPE_CHECKING:
     from onpy.elements.partstudio import PartStudio
 
 
+# Featurescript to get the face of a default plane
+_DEFAULT_PLANE_TMPL = (
+    "function(context is Context, queries) {{ "
+    "return transientQueriesToStrings(evaluateQuery(context, "
+    'qCreatedBy(makeId("{orientation}"), EntityType.FACE))); '
+    "}}"
+)
+
+# Featurescript to get the face created by a plane feature
+_OFFSET_PLANE_TMPL = (
+    "function(context is Context, queries) {{ "
+    'var feature_id = makeId("{feature_id}"); '
+    "var face = evaluateQuery(context, qCreatedBy(feature_id, EntityType.FACE))[0]; "
+    "return transientQueriesToStrings(face); "
+    "}}"
+)
+
+
 class Plane(Feature):
     """Abstract Base Class for all Planes"""
 
@@ -91,28 +108,20 @@ class DefaultPlane(Plane):
             The plane ID
         """
 
-        plane_script = dedent(
-            """
-            function(context is Context, queries) {
-                return transientQueriesToStrings(evaluateQuery(context, qCreatedBy(makeId("ORIENTATION"), EntityType.FACE))); 
-            }
-            """.replace(
-                "ORIENTATION", self.orientation.value
-            )
-        )
+        plane_script = _DEFAULT_PLANE_TMPL.format(orientation=self.orientation.value)
 
         response = self._client._api.endpoints.eval_featurescript(
             document_id=self.document.id,
             version=WorkspaceWVM(self.document.default_workspace.id),
             element_id=self.partstudio.id,
             script=plane_script,
-            return_type=model.FeaturescriptResponse,
+            return_type=model.FeaturescriptStringArrayResponse,
         )
 
-        plane_id = unwrap(
+        plane_ids = unwrap(
             response.result, message="Featurescript failed to load default plane"
-        )["value"][0]["value"]
-        return plane_id
+        ).value
+        return plane_ids[0].value
 
     @override
     def _to_model(self):
@@ -165,18 +174,7 @@ class OffsetPlane(Plane):
     @override
     def transient_id(self) -> str:
 
-        script = dedent(
-            f"""
-
-        function(context is Context, queries) {{
-
-            var feature_id = makeId("{self.id}");
-            var face = evaluateQuery(context, qCreatedBy(feature_id, EntityType.FACE))[0];
-            return transientQueriesToStrings(face);
-
-        }}
-            """
-        )
+        script = _OFFSET_PLANE_TMPL.format(feature_id=self.id)
 
         response = self._client._api.endpoints.eval_featurescript(
             document_id=self.document.id,
@@ -11,10 +11,9 @@ OnPy - May 2024 - Kyle Tennison
 
 import copy
 import math
-from textwrap import dedent
 import numpy as np
 from loguru import logger
-from typing import TYPE_CHECKING, Sequence, override
+from typing import TYPE_CHECKING, Callable, Sequence, override
 
 import onpy.api.model as model
 from onpy.entities import EntityFilter
@@ -23,6 +22,7 @@ from onpy.api.versioning import WorkspaceWVM
 from onpy.entities import Entity, FaceEntity, VertexEntity, EdgeEntity
 from onpy.util.exceptions import OnPyFeatureError
 from onpy.util.misc import unwrap, Point2D, UnitSystem
+from onpy.util.transforms import batch_mirror, batch_rotate
 from onpy.features.sketch.sketch_items import SketchItem
 from onpy.entities.protocols import FaceEntityConvertible
 from onpy.features.sketch.sketch_items import SketchCircle, SketchLine, SketchArc
@@ -32,6 +32,16 @@ if TYPE_CHECKING:
     from onpy.features.planes import Plane
 
 
+# Featurescript to get the entities created by a sketch
+_SKETCH_ENTITIES_TMPL = (
+    "function(context is Context, queries) {{ "
+    'var feature_id = makeId("{feature_id}"); '
+    "var faces = evaluateQuery(context, qCreatedBy(feature_id)); "
+    "return transientQueriesToStrings(faces); "
+    "}}"
+)
+
+
 class Sketch(Feature, FaceEntityConvertible):
     """The OnShape Sketch Feature, used to build 2D geometries"""
 
@@ -262,13 +272,14 @@ class Sketch(Feature, FaceEntityConvertible):
         opening_angle = math.acos((a**2 + b**2 - c**2) / (2 * a * b))
 
         # find the vector that is between the two lines
-        line_1_vec = np.array(((vertex_1.x - center.x), (vertex_1.y - center.y)))
-        line_2_vec = np.array(((vertex_2.x - center.x), (vertex_2.y - center.y)))
-
-        line_1_angle = math.atan2(line_1_vec[1], line_1_vec[0]) % (math.pi * 2)
-        line_2_angle = math.atan2(line_2_vec[1], line_2_vec[0]) % (math.pi * 2)
+        line_1_angle = math.atan2(vertex_1.y - center.y, vertex_1.x - center.x) % (
+            math.pi * 2
+        )
+        line_2_angle = math.atan2(vertex_2.y - center.y, vertex_2.x - center.x) % (
+            math.pi * 2
+        )
 
-        center_angle = np.average((line_1_angle, line_2_angle))  # relative to x-axis
+        center_angle = (line_1_angle + line_2_angle) / 2  # relative to x-axis
 
         # find the distance of the fillet centerpoint from the intersection point
         arc_center_offset = radius / math.sin(opening_angle / 2)
@@ -406,29 +417,21 @@ class Sketch(Feature, FaceEntityConvertible):
             An EntityFilter object used to query entities
         """
 
-        script = dedent(
-            f"""
-            function(context is Context, queries) {{
-                var feature_id = makeId("{self.id}");
-                var faces = evaluateQuery(context, qCreatedBy(feature_id));
-                return transientQueriesToStrings(faces);
-            }}
-            """
-        )
+        script = _SKETCH_ENTITIES_TMPL.format(feature_id=self.id)
 
         response = self._client._api.endpoints.eval_featurescript(
             document_id=self._partstudio.document.id,
             version=WorkspaceWVM(self._partstudio.document.default_workspace.id),
             element_id=self._partstudio.id,
             script=script,
-            return_type=model.FeaturescriptResponse,
+            return_type=model.FeaturescriptStringArrayResponse,
         )
 
         transient_ids_raw = unwrap(
             response.result, message="Featurescript failed get entities owned by part"
-        )["value"]
+        ).value
 
-        entities = [Entity(i["value"]) for i in transient_ids_raw]
+        entities = [Entity(i.value) for i in transient_ids_raw]
 
         return EntityFilter(partstudio=self.partstudio, available=entities)
 
@@ -439,34 +442,71 @@ class Sketch(Feature, FaceEntityConvertible):
     @property
     def vertices(self) -> EntityFilter[VertexEntity]:
         """An object used for interfacing with vertex entities on this sketch"""
-        return EntityFilter(
-            partstudio=self._partstudio,
-            available=self.entities.is_type(VertexEntity)._available,
-        )
+        return self.entities.is_type(VertexEntity)
 
     @property
     def edges(self) -> EntityFilter[EdgeEntity]:
         """An object used for interfacing with edge entities on this sketch"""
-        return EntityFilter(
-            partstudio=self._partstudio,
-            available=self.entities.is_type(EdgeEntity)._available,
-        )
+        return self.entities.is_type(EdgeEntity)
 
     @property
     def faces(self) -> EntityFilter[FaceEntity]:
         """An object used for interfacing with face entities on this sketch"""
-        return EntityFilter(
-            partstudio=self._partstudio,
-            available=self.entities.is_type(FaceEntity)._available,
-        )
+        return self.entities.is_type(FaceEntity)
+
+    def _apply_transform[
+        T: SketchItem
+    ](
+        self,
+        items: Sequence[T],
+        transform: Callable[[np.ndarray], np.ndarray],
+        reflect: bool = False,
+    ) -> list[T]:
+        """Transforms sketch items in one batched operation and replaces them
+        with the transformed items
+
+        Args:
+            items: The sketch items to transform
+            transform: A rigid transform that maps an (N, 2) array of points
+                to an (N, 2) array of transformed points
+            reflect: Whether or not the transform reverses orientation
+
+        Returns:
+            A list of the new items, in the same order as the provided items
+        """
+
+        control_points = [i._control_points for i in items]
+        coords = np.array(
+            [p.as_tuple for points in control_points for p in points],
+            dtype=np.float64,
+        ).reshape(-1, 2)
+
+        transformed = transform(coords).tolist()
+
+        new_items: list[T] = []
+        idx = 0
+
+        for item, points in zip(items, control_points):
+            new_points = [
+                Point2D(x, y) for x, y in transformed[idx : idx + len(points)]
+            ]
+            idx += len(points)
+
+            new_item = item._transformed(new_points, reflect)
+            self._items.remove(item)
+            self._items.add(new_item)
+            new_items.append(new_item)
+
+        self._update_feature()
+        return new_items
 
     def mirror[
         T: SketchItem
     ](
         self,
         items: Sequence[T],
-        line_point: tuple[float, float],
-        line_dir: tuple[float, float],
+        line_point: tuple[float, float] | Point2D,
+        line_dir: tuple[float, float] | Point2D,
         copy: bool = True,
     ) -> list[T]:
         """Mirrors sketch items about a line
@@ -485,14 +525,23 @@ class Sketch(Feature, FaceEntityConvertible):
         if copy:
             items = tuple([i.clone() for i in items])
 
-        return [i.mirror(line_point, line_dir) for i in items]
+        a = np.array(Point2D.from_pair(line_point).as_tuple, dtype=np.float64)
+        b = np.array(Point2D.from_pair(line_dir).as_tuple, dtype=np.float64)
+
+        if self._client.units is UnitSystem.INCH:
+            a *= 0.0254
+            b *= 0.0254
+
+        return self._apply_transform(
+            items, lambda xy: batch_mirror(xy, a, b), reflect=True
+        )
 
     def rotate[
         T: SketchItem
     ](
         self,
         items: Sequence[T],
-        origin: tuple[float, float],
+        origin: tuple[float, float] | Point2D,
         theta: float,
         copy: bool = False,
     ) -> list[T]:
@@ -512,7 +561,13 @@ class Sketch(Feature, FaceEntityConvertible):
         if copy:
             items = tuple([i.clone() for i in items])
 
-        return [i.rotate(origin, theta) for i in items]
+        pivot = np.array(Point2D.from_pair(origin).as_tuple, dtype=np.float64)
+        radians = math.radians(theta)
+
+        if self._client.units is UnitSystem.INCH:
+            pivot *= 0.0254
+
+        return self._apply_transform(items, lambda xy: batch_rotate(xy, pivot, radians))
 
     def translate[
         T: SketchItem
@@ -536,7 +591,13 @@ class Sketch(Feature, FaceEntityConvertible):
             items = tuple([i.clone() for i in items])
             # self._items.update(items)
 
-        return [i.translate(x, y) for i in items]
+        if self._client.units is UnitSystem.INCH:
+            x *= 0.0254
+            y *= 0.0254
+
+        offset = np.array([x, y])
+
+        return self._apply_transform(items, lambda xy: xy + offset)
 
     def circular_pattern[
         T: SketchItem
@@ -12,11 +12,12 @@ OnPy - May 2024 - Kyle Tennison
 
 """
 
+import os
 import copy
 import math
-import uuid
+import time
+import itertools
 from loguru import logger
-import numpy as np
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Self, override
 
@@ -27,10 +28,20 @@ if TYPE_CHECKING:
     from onpy.features import Sketch
 
 
+# entity ids only need to be unique, so a process-local counter is used
+_entity_id_counter = itertools.count()
+_entity_id_prefix = f"{os.getpid():x}{int(time.time()):x}"
+
+# shared default dir of circles and arcs; safe to share since Point2D is frozen
+_DEFAULT_DIR = Point2D(1.0, 0.0)
+
+
 class SketchItem(ABC):
     """Represents an item that the user added to the sketch. *Not* the same
     as an entity."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def sketch(self) -> "Sketch":
@@ -41,7 +52,26 @@ class SketchItem(ABC):
         """Converts the item into the corresponding api model"""
         ...
 
+    @property
+    @abstractmethod
+    def _control_points(self) -> list[Point2D]:
+        """The points that define the position of the item"""
+        ...
+
     @abstractmethod
+    def _transformed(self, points: list[Point2D], reflect: bool) -> Self:
+        """Creates a new item from its control points after a rigid transform
+
+        Args:
+            points: The transformed control points, in the same order as
+                _control_points
+            reflect: Whether or not the transform reverses orientation
+
+        Returns:
+            A new sketch object
+        """
+        ...
+
     def translate(self, x: float = 0, y: float = 0) -> Self:
         """Linear translation of the entity
 
@@ -52,10 +82,9 @@ class SketchItem(ABC):
         Returns:
             A new sketch object
         """
-        ...
+        return self.sketch.translate([self], x, y)[0]
 
-    @abstractmethod
-    def rotate(self, origin: tuple[float, float], theta: float) -> Self:
+    def rotate(self, origin: tuple[float, float] | Point2D, theta: float) -> Self:
         """Rotates the entity about a point
 
         Args:
@@ -65,11 +94,12 @@ class SketchItem(ABC):
         Returns:
             A new sketch object
         """
-        ...
+        return self.sketch.rotate([self], origin, theta)[0]
 
-    @abstractmethod
     def mirror(
-        self, line_start: tuple[float, float], line_end: tuple[float, float]
+        self,
+        line_start: tuple[float, float] | Point2D,
+        line_end: tuple[float, float] | Point2D,
     ) -> Self:
         """Mirror the entity about a line
 
@@ -80,74 +110,7 @@ class SketchItem(ABC):
         Returns:
             A new entity object
         """
-        ...
-
-    @staticmethod
-    def _mirror_point(
-        point: Point2D, line_start: Point2D, line_end: Point2D
-    ) -> Point2D:
-        """Mirrors the point across a line
-
-        Args:
-            point: The point to mirror
-            line_start: The point where the line starts
-            line_end: The point where the line ends
-
-        Returns:
-            The mirrored point
-        """
-
-        q_i = np.array(line_start.as_tuple)
-        q_j = np.array(line_end.as_tuple)
-        p_0 = np.array(point.as_tuple)
-
-        a = q_i[1] - q_j[1]
-        b = q_j[0] - q_i[0]
-        c = -(a * q_i[0] + b * q_i[1])
-
-        p_k = (
-            np.array([[b**2 - a**2, -2 * a * b], [-2 * a * b, a**2 - b**2]]) @ p_0
-            - 2 * c * np.array([a, b])
-        ) / (a**2 + b**2)
-
-        return Point2D.from_pair(p_k)
-
-    @staticmethod
-    def _rotate_point(point: Point2D, pivot: Point2D, degrees: float) -> Point2D:
-        """Rotates a point about another point
-
-        Args:
-            point: The point to rotate
-            pivot: The pivot to rotate about
-            degrees: The degrees to rotate by
-
-        Returns:
-            The rotated point
-        """
-
-        dx = point.x - pivot.x
-        dy = point.y - pivot.y
-
-        radius = math.sqrt(dx**2 + dy**2)
-        start_angle = math.atan2(dy, dx)
-        end_angle = start_angle + math.radians(degrees)
-
-        new_x = radius * math.cos(end_angle)
-        new_y = radius * math.sin(end_angle)
-
-        return Point2D(new_x, new_y)
-
-    def _replace_entity(self, new_entity: "SketchItem") -> None:
-        """Replaces the existing entity with a new entity and refreshes the
-        feature
-
-        Args:
-            new_entity: The entity to replace with
-        """
-
-        self.sketch._items.remove(self)
-        self.sketch._items.add(new_entity)
-        self.sketch._update_feature()
+        return self.sketch.mirror([self], line_start, line_end, copy=False)[0]
 
     def clone(self) -> Self:
         """Creates a copy of the entity"""
@@ -204,8 +167,8 @@ class SketchItem(ABC):
         return entities
 
     def _generate_entity_id(self) -> str:
-        """Generates a random entity id"""
-        return str(uuid.uuid4()).replace("-", "")
+        """Generates a unique entity id"""
+        return f"{_entity_id_prefix}{next(_entity_id_counter):x}"
 
     def __str__(self) -> str:
         return repr(self)
@@ -217,13 +180,24 @@ class SketchItem(ABC):
 class SketchCircle(SketchItem):
     """A sketch circle"""
 
+    __slots__ = (
+        "_sketch",
+        "radius",
+        "center",
+        "units",
+        "dir",
+        "clockwise",
+        "entity_id",
+        "_center_id",
+    )
+
     def __init__(
         self,
         sketch: "Sketch",
         radius: float,
         center: Point2D,
         units: UnitSystem,
-        dir: tuple[float, float] = (1, 0),
+        dir: tuple[float, float] | Point2D | None = None,
         clockwise: bool = False,
     ):
         """
@@ -240,9 +214,10 @@ class SketchCircle(SketchItem):
         self.radius = radius
         self.center = center
         self.units = units
-        self.dir = Point2D.from_pair(dir)
+        self.dir = _DEFAULT_DIR if dir is None else Point2D.from_pair(dir)
         self.clockwise = clockwise
         self.entity_id = self._generate_entity_id()
+        self._center_id = f"{self.entity_id}.center"
 
     @override
     def to_model(self) -> model.SketchCurveEntity:
@@ -257,8 +232,8 @@ class SketchCircle(SketchItem):
                 "ydir": self.dir.y,
                 "clockwise": self.clockwise,
             },
-            centerId=f"{self.entity_id}.center",
-            entityId=f"{self.entity_id}",
+            centerId=self._center_id,
+            entityId=self.entity_id,
         )
 
     @property
@@ -266,63 +241,21 @@ class SketchCircle(SketchItem):
     def sketch(self) -> "Sketch":
         return self._sketch
 
+    @property
     @override
-    def rotate(self, origin: tuple[float, float], theta: float) -> "SketchCircle":
-        new_center = self._rotate_point(self.center, Point2D.from_pair(origin), theta)
-        new_entity = SketchCircle(
-            sketch=self.sketch,
-            radius=self.radius,
-            center=new_center,
-            units=self.units,
-            dir=self.dir.as_tuple,
-            clockwise=self.clockwise,
-        )
-        self._replace_entity(new_entity)
-        return new_entity
+    def _control_points(self) -> list[Point2D]:
+        return [self.center]
 
     @override
-    def translate(self, x: float, y: float) -> "SketchCircle":
-
-        if self._sketch._client.units is UnitSystem.INCH:
-            x *= 0.0254
-            y *= 0.0254
-
-        new_center = Point2D(self.center.x + x, self.center.y + y)
-        new_entity = SketchCircle(
+    def _transformed(self, points: list[Point2D], reflect: bool) -> "SketchCircle":
+        return SketchCircle(
             sketch=self.sketch,
             radius=self.radius,
-            center=new_center,
+            center=points[0],
             units=self.units,
-            dir=self.dir.as_tuple,
+            dir=self.dir,
             clockwise=self.clockwise,
         )
-        self._replace_entity(new_entity)
-        return new_entity
-
-    @override
-    def mirror(
-        self, line_start: tuple[float, float], line_end: tuple[float, float]
-    ) -> "SketchCircle":
-        mirror_start = Point2D.from_pair(line_start)
-        mirror_end = Point2D.from_pair(line_end)
-
-        # to avoid confusion
-        del line_start
-        del line_end
-
-        new_center = self._mirror_point(self.center, mirror_start, mirror_end)
-
-        new_entity = SketchCircle(
-            sketch=self.sketch,
-            radius=self.radius,
-            center=new_center,
-            units=self.units,
-            dir=self.dir.as_tuple,
-            clockwise=self.clockwise,
-        )
-
-        self._replace_entity(new_entity)
-        return new_entity
 
     @override
     def __repr__(self) -> str:
@@ -332,6 +265,16 @@ class SketchCircle(SketchItem):
 class SketchLine(SketchItem):
     """A straight sketch line segment"""
 
+    __slots__ = (
+        "_sketch",
+        "start",
+        "end",
+        "units",
+        "entity_id",
+        "_start_id",
+        "_end_id",
+    )
+
     def __init__(
         self,
         sketch: "Sketch",
@@ -352,6 +295,8 @@ class SketchLine(SketchItem):
         self.end = end_point
         self.units = units
         self.entity_id = self._generate_entity_id()
+        self._start_id = f"{self.entity_id}.start"
+        self._end_id = f"{self.entity_id}.end"
 
     @property
     def dx(self) -> float:
@@ -366,7 +311,7 @@ class SketchLine(SketchItem):
     @property
     def length(self) -> float:
         """The length of the line"""
-        return abs(math.sqrt(self.dx**2 + self.dy**2))
+        return math.hypot(self.dx, self.dy)
 
     @property
     def theta(self) -> float:
@@ -376,73 +321,42 @@ class SketchLine(SketchItem):
     @property
     def dir(self) -> Point2D:
         """A vector pointing in the direction of the line"""
-        return Point2D(math.cos(self.theta), math.sin(self.theta))
+
+        # same as (cos(theta), sin(theta)), without the trig
+        dx = self.end.x - self.start.x
+        dy = self.end.y - self.start.y
+        length = math.hypot(dx, dy)
+
+        if length == 0:
+            return Point2D(1.0, 0.0)
+
+        return Point2D(dx / length, dy / length)
 
     @property
     @override
     def sketch(self):
         return self._sketch
 
+    @property
     @override
-    def rotate(self, origin: tuple[float, float], theta: float) -> "SketchLine":
-        new_start = self._rotate_point(
-            self.start, Point2D.from_pair(origin), degrees=theta
-        )
-        new_end = self._rotate_point(self.end, Point2D.from_pair(origin), degrees=theta)
-
-        new_entity = SketchLine(
-            sketch=self._sketch,
-            start_point=new_start,
-            end_point=new_end,
-            units=self.units,
-        )
-        self._replace_entity(new_entity)
-        return new_entity
+    def _control_points(self) -> list[Point2D]:
+        return [self.start, self.end]
 
     @override
-    def mirror(
-        self, line_start: tuple[float, float], line_end: tuple[float, float]
-    ) -> "SketchLine":
-        mirror_start = Point2D.from_pair(line_start)
-        mirror_end = Point2D.from_pair(line_end)
-
-        new_start = self._mirror_point(self.start, mirror_start, mirror_end)
-        new_end = self._mirror_point(self.end, mirror_start, mirror_end)
-
-        new_entity = SketchLine(
+    def _transformed(self, points: list[Point2D], reflect: bool) -> "SketchLine":
+        return SketchLine(
             sketch=self._sketch,
-            start_point=new_start,
-            end_point=new_end,
+            start_point=points[0],
+            end_point=points[1],
             units=self.units,
         )
-        self._replace_entity(new_entity)
-        return new_entity
-
-    @override
-    def translate(self, x: float = 0, y: float = 0) -> "SketchLine":
-
-        if self._sketch._client.units is UnitSystem.INCH:
-            x *= 0.0254
-            y *= 0.0254
-
-        new_start = Point2D(self.start.x + x, self.start.y + y)
-        new_end = Point2D(self.end.x + x, self.end.y + y)
-
-        new_entity = SketchLine(
-            sketch=self._sketch,
-            start_point=new_start,
-            end_point=new_end,
-            units=self.units,
-        )
-        self._replace_entity(new_entity)
-        return new_entity
 
     @override
     def to_model(self) -> model.SketchCurveSegmentEntity:
         return model.SketchCurveSegmentEntity(
             entityId=self.entity_id,
-            startPointId=f"{self.entity_id}.start",
-            endPointId=f"{self.entity_id}.end",
+            startPointId=self._start_id,
+            endPointId=self._end_id,
             startParam=0,
             endParam=self.length,
             geometry={
@@ -462,6 +376,20 @@ class SketchLine(SketchItem):
 class SketchArc(SketchItem):
     """A sketch arc"""
 
+    __slots__ = (
+        "_sketch",
+        "radius",
+        "center",
+        "theta_interval",
+        "dir",
+        "clockwise",
+        "entity_id",
+        "units",
+        "_start_id",
+        "_end_id",
+        "_center_id",
+    )
+
     def __init__(
         self,
         sketch: "Sketch",
@@ -469,7 +397,7 @@ class SketchArc(SketchItem):
         center: Point2D,
         theta_interval: tuple[float, float],
         units: UnitSystem,
-        dir: tuple[float, float] = (1, 0),
+        dir: tuple[float, float] | Point2D | None = None,
         clockwise: bool = False,
     ):
         """
@@ -487,133 +415,69 @@ class SketchArc(SketchItem):
         self.radius = radius
         self.center = center
         self.theta_interval = theta_interval
-        self.dir = dir
+        self.dir = _DEFAULT_DIR if dir is None else Point2D.from_pair(dir)
         self.clockwise = clockwise
         self.entity_id = self._generate_entity_id()
         self.units = units
+        self._start_id = f"{self.entity_id}.start"
+        self._end_id = f"{self.entity_id}.end"
+        self._center_id = f"{self.entity_id}.center"
 
     @property
     @override
     def sketch(self):
         return self._sketch
 
+    @property
     @override
-    def mirror(
-        self, line_start: tuple[float, float], line_end: tuple[float, float]
-    ) -> "SketchArc":
-        mirror_start = Point2D.from_pair(line_start)
-        mirror_end = Point2D.from_pair(line_end)
-
-        # to avoid confusion
-        del line_start
-        del line_end
-
-        start_point = Point2D(
-            self.radius * math.cos(self.theta_interval[0]) + self.center.x,
-            self.radius * math.sin(self.theta_interval[0]) + self.center.y,
-        )
-
-        start_point = self._mirror_point(start_point, mirror_start, mirror_end)
-        new_center = self._mirror_point(self.center, mirror_start, mirror_end)
-
-        arc_start_vector = np.array(
-            [start_point.x - new_center.x, start_point.y - new_center.y]
-        )
-        mirror_line_vector = np.array(
-            [mirror_end.x - mirror_start.x, mirror_end.y - mirror_start.y]
-        )
-
-        angle_offset = 2 * math.acos(
-            np.dot(arc_start_vector, mirror_line_vector)
-            / (np.linalg.norm(arc_start_vector) * np.linalg.norm(mirror_line_vector))
-        )
-
-        d_theta = self.theta_interval[1] - self.theta_interval[0]
-
-        new_theta = (
-            (self.theta_interval[0] - angle_offset - d_theta),
-            (self.theta_interval[0] - angle_offset),
-        )
-
-        new_entity = SketchArc(
-            sketch=self._sketch,
-            radius=self.radius,
-            center=new_center,
-            theta_interval=new_theta,
-            units=self.units,
-            dir=self.dir,
-            clockwise=self.clockwise,
-        )
-        self._replace_entity(new_entity)
-        return new_entity
+    def _control_points(self) -> list[Point2D]:
+        return [
+            self.center,
+            Point2D(
+                self.radius * math.cos(self.theta_interval[0]) + self.center.x,
+                self.radius * math.sin(self.theta_interval[0]) + self.center.y,
+            ),
+            Point2D(
+                self.radius * math.cos(self.theta_interval[1]) + self.center.x,
+                self.radius * math.sin(self.theta_interval[1]) + self.center.y,
+            ),
+        ]
 
     @override
-    def translate(self, x: float = 0, y: float = 0) -> "SketchArc":
+    def _transformed(self, points: list[Point2D], reflect: bool) -> "SketchArc":
+        new_center, start_point, end_point = points
 
-        if self._sketch._client.units is UnitSystem.INCH:
-            x *= 0.0254
-            y *= 0.0254
+        # a reflection reverses the arc, so the old end becomes the new start
+        new_start = end_point if reflect else start_point
+        theta_start = math.atan2(new_start.y - new_center.y, new_start.x - new_center.x)
+        d_theta = self.theta_interval[1] - self.theta_interval[0]
 
-        new_center = Point2D(self.center.x + x, self.center.y + y)
-        new_entity = SketchArc(
+        return SketchArc(
             sketch=self._sketch,
             radius=self.radius,
             center=new_center,
-            theta_interval=self.theta_interval,
+            theta_interval=(theta_start, theta_start + d_theta),
             units=self.units,
             dir=self.dir,
             clockwise=self.clockwise,
         )
-        self._replace_entity(new_entity)
-        return new_entity
-
-    @override
-    def rotate(self, origin: tuple[float, float], theta: float) -> "SketchArc":
-        pivot = Point2D.from_pair(origin)
-
-        start_point = Point2D(
-            self.radius * math.cos(self.theta_interval[0]) + self.center.x,
-            self.radius * math.sin(self.theta_interval[0]) + self.center.y,
-        )
-        end_point = Point2D(
-            self.radius * math.cos(self.theta_interval[1]) + self.center.x,
-            self.radius * math.sin(self.theta_interval[1]) + self.center.y,
-        )
-
-        new_center = self._rotate_point(self.center, pivot, theta)
-        start_point = self._rotate_point(start_point, pivot, theta)
-        end_point = self._rotate_point(end_point, pivot, theta)
-
-        new_entity = SketchArc.three_point_with_midpoint(
-            sketch=self._sketch,
-            center=new_center,
-            radius=self.radius,
-            endpoint_1=start_point,
-            endpoint_2=end_point,
-            units=self.units,
-            dir=self.dir,
-            clockwise=self.clockwise,
-        )
-
-        self._replace_entity(new_entity)
-        return new_entity
 
     @override
     def to_model(self) -> model.SketchCurveSegmentEntity:
         return model.SketchCurveSegmentEntity(
-            startPointId=f"{self.entity_id}.start",
-            endPointId=f"{self.entity_id}.end",
+            startPointId=self._start_id,
+            endPointId=self._end_id,
             startParam=self.theta_interval[0],
             endParam=self.theta_interval[1],
-            centerId=f"{self.entity_id}.center",
-            entityId=f"{self.entity_id}",
+            centerId=self._center_id,
+            entityId=self.entity_id,
             geometry={
                 "btType": "BTCurveGeometryCircle-115",
                 "radius": self.radius,
                 "xcenter": self.center.x,
                 "ycenter": self.center.y,
-                "xdir": self.dir[0],
-                "ydir": self.dir[1],
+                "xdir": self.dir.x,
+                "ydir": self.dir.y,
             },
         )
 
@@ -626,7 +490,7 @@ class SketchArc(SketchItem):
         endpoint_1: Point2D,
         endpoint_2: Point2D,
         units: UnitSystem,
-        dir: tuple[float, float] = (1, 0),
+        dir: tuple[float, float] | Point2D | None = None,
         clockwise: bool = False,
     ) -> "SketchArc":
         """Constructs a new instance of a SketchArc using endpoints instead
@@ -10,7 +10,6 @@ OnPy - May 2024 - Kyle Tennison
 """
 
 from loguru import logger
-from textwrap import dedent
 from prettytable import PrettyTable
 from typing import TYPE_CHECKING, Any, override
 
@@ -25,6 +24,16 @@ if TYPE_CHECKING:
     from onpy.elements.partstudio import PartStudio
 
 
+# Featurescript to get the entities of a certain type owned by a part
+_OWNED_BY_TYPE_TMPL = (
+    "function(context is Context, queries) {{ "
+    'var part = {{ "queryType" : QueryType.TRANSIENT, "transientId" : "{part_id}" }} as Query; '
+    "var part_faces = qOwnedByBody(part, EntityType.{type}); "
+    "return transientQueriesToStrings(evaluateQuery(context, part_faces)); "
+    "}}"
+)
+
+
 class Part(BodyEntityConvertible):
     """Represents a Part in an OnShape partstudio"""
 
@@ -55,30 +64,21 @@ class Part(BodyEntityConvertible):
             A list of transient ids of the resulting queries
         """
 
-        script = dedent(
-            f"""
-            function(context is Context, queries) {{
-                var part = {{ "queryType" : QueryType.TRANSIENT, "transientId" : "{self.id}" }} as Query;    
-                var part_faces = qOwnedByBody(part, EntityType.{type.upper()});
-
-                return transientQueriesToStrings( evaluateQuery(context, part_faces) ); 
-            }}
-            """
-        )
+        script = _OWNED_BY_TYPE_TMPL.format(part_id=self.id, type=type.upper())
 
         response = self._client._api.endpoints.eval_featurescript(
             document_id=self._partstudio.document.id,
             version=WorkspaceWVM(self._partstudio.document.default_workspace.id),
             element_id=self._partstudio.id,
             script=script,
-            return_type=model.FeaturescriptResponse,
+            return_type=model.FeaturescriptStringArrayResponse,
         )
 
         transient_ids_raw = unwrap(
             response.result, message="Featurescript failed get entities owned by part"
-        )["value"]
+        ).value
 
-        transient_ids = [i["value"] for i in transient_ids_raw]
+        transient_ids = [i.value for i in transient_ids_raw]
 
         return transient_ids
 
@@ -107,21 +107,27 @@ class Part(BodyEntityConvertible):
     def vertices(self) -> EntityFilter[VertexEntity]:
         """An object used for interfacing with vertex entities on this part"""
         return EntityFilter(
-            partstudio=self._partstudio, available=self._vertex_entities()
+            partstudio=self._partstudio,
+            available=self._vertex_entities(),
+            entity_type=VertexEntity,
         )
 
     @property
     def edges(self) -> EntityFilter[EdgeEntity]:
         """An object used for interfacing with edge entities on this part"""
         return EntityFilter(
-            partstudio=self._partstudio, available=self._edge_entities()
+            partstudio=self._partstudio,
+            available=self._edge_entities(),
+            entity_type=EdgeEntity,
         )
 
     @property
     def faces(self) -> EntityFilter[FaceEntity]:
         """An object used for interfacing with face entities on this part"""
         return EntityFilter(
-            partstudio=self._partstudio, available=self._face_entities()
+            partstudio=self._partstudio,
+            available=self._face_entities(),
+            entity_type=FaceEntity,
         )
 
     def __repr__(self) -> str:
@@ -134,9 +134,9 @@ class UnitSystem(Enum):
         return {UnitSystem.INCH: "inch", UnitSystem.METRIC: "meter"}[self]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Point2D:
-    """Represents a 2D point"""
+    """Represents an immutable 2D point"""
 
     x: float
     y: float
@@ -157,8 +157,10 @@ class Point2D:
         return self.x == other.x and self.y == other.y
 
     @classmethod
-    def from_pair(cls, tuple: tuple[float, float]) -> Self:
-        return cls(*tuple)
+    def from_pair(cls, tuple: "tuple[float, float] | Point2D") -> Self:
+        if isinstance(tuple, cls):
+            return tuple  # points are immutable, so no copy is needed
+        return cls(tuple[0], tuple[1])
 
     @property
     def as_tuple(self) -> tuple[float, float]:
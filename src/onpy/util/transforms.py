@@ -0,0 +1,146 @@
+"""
+
+Batched transforms of 2D points
+
+Sketch items are moved by transforming the points that define them. The
+functions to transform many points at once are defined here. They use numpy;
+if numba is installed, large batches use compiled kernels instead. Numba is
+only imported once a batch is large enough to need it, as importing it and
+loading the kernels costs more than transforming a typical sketch.
+
+OnPy - May 2024 - Kyle Tennison
+
+"""
+
+import math
+import numpy as np
+from functools import cache
+from typing import Callable
+
+# the number of points at which the compiled kernels are used
+_NUMBA_MIN_POINTS = 100_000
+
+
+def batch_mirror(xy: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Mirrors points across a line
+
+    Args:
+        xy: An (N, 2) array of the points to mirror
+        a: A point on the mirror line
+        b: Another point on the mirror line
+
+    Returns:
+        An (N, 2) array of the mirrored points
+    """
+
+    if xy.shape[0] >= _NUMBA_MIN_POINTS and (kernels := _compiled_kernels()):
+        return kernels[0](xy, a, b)
+
+    return _batch_mirror_numpy(xy, a, b)
+
+
+def batch_rotate(xy: np.ndarray, origin: np.ndarray, theta: float) -> np.ndarray:
+    """Rotates points about another point
+
+    Args:
+        xy: An (N, 2) array of the points to rotate
+        origin: The point to rotate about
+        theta: The radians to rotate by. Positive is ccw
+
+    Returns:
+        An (N, 2) array of the rotated points
+    """
+
+    if xy.shape[0] >= _NUMBA_MIN_POINTS and (kernels := _compiled_kernels()):
+        return kernels[1](xy, origin, theta)
+
+    return _batch_rotate_numpy(xy, origin, theta)
+
+
+@cache
+def _compiled_kernels() -> tuple[Callable[..., np.ndarray], ...] | None:
+    """Compiles the loop kernels with numba, if it is installed
+
+    Returns:
+        The compiled mirror and rotate kernels, or None if numba is missing
+    """
+
+    try:
+        import numba  # optional; compiles the kernels below
+    except ImportError:
+        return None
+
+    # cache=True saves the compiled kernels so they are only built once
+    jit = numba.njit(cache=True, fastmath=True)
+
+    return jit(_batch_mirror_kernel), jit(_batch_rotate_kernel)
+
+
+def _batch_mirror_numpy(xy: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Matrix form of batch_mirror"""
+
+    dx = b[0] - a[0]
+    dy = b[1] - a[1]
+    length = math.hypot(dx, dy)
+
+    # unit normal of the mirror line
+    nx = -dy / length
+    ny = dx / length
+    d = 2 * (a[0] * nx + a[1] * ny)
+
+    matrix = np.array(
+        [[1 - 2 * nx * nx, -2 * nx * ny], [-2 * nx * ny, 1 - 2 * ny * ny]]
+    )
+
+    return xy @ matrix.T + np.array([d * nx, d * ny])
+
+
+def _batch_rotate_numpy(xy: np.ndarray, origin: np.ndarray, theta: float) -> np.ndarray:
+    """Matrix form of batch_rotate"""
+
+    c = math.cos(theta)
+    s = math.sin(theta)
+    ox = origin[0]
+    oy = origin[1]
+
+    matrix = np.array([[c, -s], [s, c]])
+    offset = np.array([ox - (c * ox - s * oy), oy - (s * ox + c * oy)])
+
+    return xy @ matrix.T + offset
+
+
+def _batch_mirror_kernel(xy: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Loop form of batch_mirror, used when compiled with numba"""
+
+    dx = b[0] - a[0]
+    dy = b[1] - a[1]
+    inv_l2 = 1.0 / (dx * dx + dy * dy)
+
+    out = np.empty_like(xy)
+
+    for i in range(xy.shape[0]):
+        # project onto the line, then reflect across the projection
+        t = ((xy[i, 0] - a[0]) * dx + (xy[i, 1] - a[1]) * dy) * inv_l2
+        out[i, 0] = 2 * (a[0] + t * dx) - xy[i, 0]
+        out[i, 1] = 2 * (a[1] + t * dy) - xy[i, 1]
+
+    return out
+
+
+def _batch_rotate_kernel(
+    xy: np.ndarray, origin: np.ndarray, theta: float
+) -> np.ndarray:
+    """Loop form of batch_rotate, used when compiled with numba"""
+
+    c = math.cos(theta)
+    s = math.sin(theta)
+
+    out = np.empty_like(xy)
+
+    for i in range(xy.shape[0]):
+        px = xy[i, 0] - origin[0]
+        py = xy[i, 1] - origin[1]
+        out[i, 0] = c * px - s * py + origin[0]
+        out[i, 1] = s * px + c * py + origin[1]
+
+    return out
@@ -0,0 +1,103 @@
+"""Tests lazy evaluation of entity filters"""
+
+from types import SimpleNamespace
+
+import onpy.api.model as model
+from onpy.util.misc import UnitSystem
+from onpy.entities import EntityFilter, Entity, FaceEntity
+
+
+class StubEndpoints:
+    """Records featurescript calls instead of sending them to OnShape"""
+
+    def __init__(self, result: list[str]) -> None:
+        self.result = result
+        self.calls: list[dict] = []
+
+    def eval_featurescript(self, document_id, version, element_id, **kwargs):
+        self.calls.append(kwargs)
+        return model.FeaturescriptStringArrayResponse(
+            result={"value": [{"value": tid} for tid in self.result]}
+        )
+
+
+def make_filter(
+    transient_ids: list[str], result: list[str]
+) -> tuple[EntityFilter, StubEndpoints]:
+    """Makes a filter on a stubbed partstudio"""
+
+    endpoints = StubEndpoints(result)
+    partstudio = SimpleNamespace(
+        id="element",
+        document=SimpleNamespace(
+            id="document", default_workspace=SimpleNamespace(id="workspace")
+        ),
+        _client=SimpleNamespace(units=UnitSystem.INCH),
+        _api=SimpleNamespace(endpoints=endpoints),
+    )
+
+    entities = [Entity(tid) for tid in transient_ids]
+
+    return EntityFilter(partstudio=partstudio, available=entities), endpoints  # type: ignore
+
+
+def test_chain_evaluates_once():
+    """Tests that a chain of filters is nested into a single call"""
+
+    entity_filter, endpoints = make_filter(["JHA", "JHB", "JHC"], ["JHB"])
+
+    chained = entity_filter.is_type(FaceEntity).largest().contains_point((1, 2, 3))
+
+    # nothing is sent until the entities are read
+    assert endpoints.calls == []
+
+    entities = chained.eval()
+
+    assert len(endpoints.calls) == 1
+    call = endpoints.calls[0]
+
+    assert call["queries"] == {"tids": ["JHA", "JHB", "JHC"]}
+    assert call["return_type"] is model.FeaturescriptStringArrayResponse
+    assert (
+        "evaluateQuery(context, qContainsPoint(qLargest(qEntityFilter("
+        "queries.tids, EntityType.FACE)), (vector([1, 2, 3]) * inch)))"
+    ) in call["script"]
+
+    assert [e.transient_id for e in entities] == ["JHB"]
+    assert all(isinstance(e, FaceEntity) for e in entities)
+
+    # reading again uses the evaluated entities
+    list(chained)
+    assert len(endpoints.calls) == 1
+
+
+def test_chain_reuses_evaluated_parent():
+    """Tests that filtering an evaluated filter only applies the new query"""
+
+    entity_filter, endpoints = make_filter(["JHA", "JHB", "JHC"], ["JHA", "JHC"])
+
+    faces = entity_filter.is_type(FaceEntity)
+    faces.eval()
+
+    endpoints.result = ["JHC"]
+    largest = faces.largest().eval()
+
+    assert len(endpoints.calls) == 2
+    call = endpoints.calls[1]
+
+    assert call["queries"] == {"tids": ["JHA", "JHC"]}
+    assert "evaluateQuery(context, qLargest(queries.tids))" in call["script"]
+    assert [e.transient_id for e in largest] == ["JHC"]
+
+
+def test_unfiltered_does_not_evaluate():
+    """Tests that filters without queries and empty filters are not sent"""
+
+    entity_filter, endpoints = make_filter(["JHA"], [])
+    assert [e.transient_id for e in entity_filter] == ["JHA"]
+
+    empty_filter, empty_endpoints = make_filter([], [])
+    assert empty_filter.largest().eval() == []
+
+    assert endpoints.calls == []
+    assert empty_endpoints.calls == []
@@ -0,0 +1,106 @@
+"""Tests the geometry of sketch transforms"""
+
+import math
+from types import SimpleNamespace
+
+import pytest
+
+from onpy.features import Sketch
+from onpy.util.misc import Point2D, UnitSystem
+from onpy.features.sketch.sketch_items import SketchArc
+
+
+@pytest.fixture(params=[UnitSystem.INCH, UnitSystem.METRIC])
+def units(request) -> UnitSystem:
+    return request.param
+
+
+@pytest.fixture
+def sketch(monkeypatch, units: UnitSystem) -> Sketch:
+    """A sketch that is never sent to OnShape"""
+
+    monkeypatch.setattr(Sketch, "_upload_feature", lambda self: None)
+    monkeypatch.setattr(Sketch, "_update_feature", lambda self: None)
+
+    client = SimpleNamespace(units=units)
+    partstudio = SimpleNamespace(document=SimpleNamespace(_client=client))
+
+    return Sketch(partstudio=partstudio, plane=None)  # type: ignore
+
+
+def scale(units: UnitSystem) -> float:
+    """The factor to convert into the meters stored on sketch items"""
+    return 0.0254 if units is UnitSystem.INCH else 1.0
+
+
+def assert_point(point: Point2D, expected: tuple[float, float], units: UnitSystem):
+    assert point.x == pytest.approx(expected[0] * scale(units), abs=1e-12)
+    assert point.y == pytest.approx(expected[1] * scale(units), abs=1e-12)
+
+
+def assert_interval(arc: SketchArc, expected: tuple[float, float]):
+    assert math.cos(arc.theta_interval[0]) == pytest.approx(math.cos(expected[0]))
+    assert math.sin(arc.theta_interval[0]) == pytest.approx(math.sin(expected[0]))
+    assert arc.theta_interval[1] - arc.theta_interval[0] == pytest.approx(
+        expected[1] - expected[0]
+    )
+
+
+def test_rotate_about_pivot(sketch: Sketch, units: UnitSystem):
+    """Tests rotating items about a point other than the origin"""
+
+    circle = sketch.add_circle((2, 0), 0.5).rotate((1, 0), 180)
+    assert_point(circle.center, (0, 0), units)
+
+    arc = sketch.add_centerpoint_arc((2, 0), 1, 0, 90).rotate((1, 0), 90)
+    center, start, end = arc._control_points
+
+    assert_point(center, (1, 1), units)
+    assert_point(start, (1, 2), units)
+    assert_point(end, (0, 1), units)
+    assert_interval(arc, (math.pi / 2, math.pi))
+    assert arc in sketch.sketch_items
+
+
+def test_mirror(sketch: Sketch, units: UnitSystem):
+    """Tests mirroring items across a line that misses the origin"""
+
+    circle = sketch.add_circle((2, 0), 0.5).mirror((1, 0), (1, 1))
+    assert_point(circle.center, (0, 0), units)
+
+    # a reflection reverses the arc, so the ends are swapped
+    arc = sketch.add_centerpoint_arc((2, 0), 1, 0, 90).mirror((1, 0), (1, 1))
+    center, start, end = arc._control_points
+
+    assert_point(center, (0, 0), units)
+    assert_point(start, (0, 1), units)
+    assert_point(end, (-1, 0), units)
+    assert_interval(arc, (math.pi / 2, math.pi))
+
+
+def test_mirror_keeps_span(sketch: Sketch, units: UnitSystem):
+    """Tests that mirroring a reflex arc does not flip it to the smaller arc"""
+
+    arc = sketch.add_centerpoint_arc((0, 0), 1, 0, 270)
+    mirrored = sketch.mirror([arc], (0, 0), (1, 0))[0]
+    center, start, end = mirrored._control_points
+
+    assert_point(center, (0, 0), units)
+    assert_point(start, (0, 1), units)
+    assert_point(end, (1, 0), units)
+    assert_interval(mirrored, (math.pi / 2, 2 * math.pi))
+
+    # mirror copies by default
+    assert arc in sketch.sketch_items
+    assert mirrored in sketch.sketch_items
+
+
+def test_default_dir_is_immutable(sketch: Sketch):
+    """Tests that the dir shared between items cannot be changed in place"""
+
+    circle = sketch.add_circle((0, 0), 1)
+    arc = sketch.add_centerpoint_arc((0, 0), 1, 0, 90)
+    assert circle.dir is arc.dir
+
+    with pytest.raises(AttributeError):
+        circle.dir.x = 0.0  # type: ignore
@@ -0,0 +1,70 @@
+"""Tests that the batched transform implementations agree"""
+
+import math
+
+import numpy as np
+import pytest
+
+from onpy.util import transforms
+
+
+@pytest.fixture(params=[0, 1, 50])
+def points(request) -> np.ndarray:
+    return np.random.default_rng(0).uniform(-10, 10, size=(request.param, 2))
+
+
+MIRROR_LINES = [
+    (np.array([0.0, 0.0]), np.array([1.0, 0.0])),
+    (np.array([1.0, 0.0]), np.array([1.0, 1.0])),
+    (np.array([-2.5, 3.0]), np.array([4.0, -1.5])),
+]
+
+
+@pytest.mark.parametrize("a, b", MIRROR_LINES)
+def test_mirror_kernel_matches_numpy(points: np.ndarray, a, b):
+    """Tests the loop mirror kernel against the numpy version"""
+
+    kernel = transforms._batch_mirror_kernel(points, a, b)
+    matrix = transforms._batch_mirror_numpy(points, a, b)
+
+    assert kernel.shape == points.shape
+    np.testing.assert_allclose(kernel, matrix, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("theta", [0, math.pi / 3, -2.0, math.pi])
+def test_rotate_kernel_matches_numpy(points: np.ndarray, theta: float):
+    """Tests the loop rotate kernel against the numpy version"""
+
+    origin = np.array([1.5, -0.5])
+
+    kernel = transforms._batch_rotate_kernel(points, origin, theta)
+    matrix = transforms._batch_rotate_numpy(points, origin, theta)
+
+    assert kernel.shape == points.shape
+    np.testing.assert_allclose(kernel, matrix, rtol=0, atol=1e-12)
+
+
+def test_compiled_kernels_match_numpy(points: np.ndarray):
+    """Tests the numba compiled kernels against the numpy versions"""
+
+    pytest.importorskip("numba")
+
+    kernels = transforms._compiled_kernels()
+    assert kernels is not None
+    mirror, rotate = kernels
+
+    a, b = MIRROR_LINES[2]
+    origin = np.array([1.5, -0.5])
+
+    np.testing.assert_allclose(
+        mirror(points, a, b),
+        transforms._batch_mirror_numpy(points, a, b),
+        rtol=0,
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(
+        rotate(points, origin, 1.0),
+        transforms._batch_rotate_numpy(points, origin, 1.0),
+        rtol=0,
+        atol=1e-12,
+    )